@@ -8,15 +8,23 @@ All timestamps in filenames and metadata are recorded in Asia/Seoul (KST).
 """
 from __future__ import annotations
 
+import bisect
 import logging
+import math
 import random
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Callable, Iterable
 
+import numpy as np
+import orjson
 import pandas as pd
 import requests
 from zoneinfo import ZoneInfo
@@ -34,19 +42,24 @@ RATIO_PERIOD = "1h"  # Long/Short ratio 및 Taker Volume period
 MAX_KLINE_LIMIT = 1500  # Binance 문서 상 Kline/Index/Mark/Premium 최대
 MAX_STAT_LIMIT = 500  # openInterest, Long/Short, Taker Vol 등 최대 limit
 MAX_RETRIES = 5  # 429/418 대응 재시도 횟수 한도
+MAX_WORKERS = 8  # 엔드포인트 동시 요청 수 (전체 심볼 공유)
+MAX_PAGE_WORKERS = 4  # 엔드포인트 하나의 페이지 동시 요청 수
+MAX_REQUESTS_PER_SEC = 20  # 전체 스레드 공유 요청 수 상한 (요청 weight는 미반영)
 
 BASE_URL = "https://fapi.binance.com"
+URL_CACHE: dict[str, str] = {}  # 엔드포인트 경로 -> 전체 URL
 SESSION = requests.Session()
+# 동시 요청 간 TLS/TCP 연결을 재사용하도록 커넥션 풀을 넉넉히 확보 (재시도는 _get에서 처리)
+SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0),
+)
+SESSION.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
 
 KST = ZoneInfo("Asia/Seoul")
-
-
-@dataclass
-class FetchStats:
-    """단순 수집 통계."""
-
-    success: int = 0
-    skipped: int = 0
+SHUTDOWN = threading.Event()  # 설정 시 백오프/레이트리밋 대기를 즉시 중단
+DAY_MS = 86_400_000
+INTERVAL_UNIT_MS = {"m": 60_000, "h": 3_600_000, "d": DAY_MS, "w": 7 * DAY_MS}
 
 
 def now_kst() -> datetime:
@@ -67,20 +80,59 @@ def jitter_delay(base_delay: float) -> float:
     return base_delay + random.uniform(0, 1)
 
 
+def _wait(seconds: float) -> None:
+    """종료 신호로 깨어날 수 있는 대기. 종료 요청 시 RuntimeError 발생."""
+
+    if SHUTDOWN.wait(seconds):
+        raise RuntimeError("Collection interrupted")
+
+
+class RateLimiter:
+    """모든 스레드가 공유하는 요청 수 제한기 (monotonic 기준 다음 허용 시각)."""
+
+    def __init__(self, rate_per_sec: float) -> None:
+        self._interval = 1.0 / rate_per_sec
+        self._lock = threading.Lock()
+        self._next_at = time.monotonic()
+
+    def acquire(self) -> None:
+        """다음 요청 슬롯을 예약하고 해당 시각까지 대기."""
+
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(self._next_at, now)
+            self._next_at = start_at + self._interval
+        if start_at > now:
+            _wait(start_at - now)
+
+    def pause(self, seconds: float) -> None:
+        """레이트리밋 응답 시 모든 스레드의 다음 요청을 ``seconds`` 뒤로 미룸."""
+
+        with self._lock:
+            self._next_at = max(self._next_at, time.monotonic() + seconds)
+
+
+RATE_LIMITER = RateLimiter(MAX_REQUESTS_PER_SEC)
+
+
 def _get(path: str, params: dict[str, Any] | None = None) -> Any:
     """공통 GET 요청 헬퍼.
 
     - 200 OK 시 JSON 반환
+    - 모든 요청은 공유 ``RATE_LIMITER``로 초당 MAX_REQUESTS_PER_SEC 이하로 제한
+      (요청 수 기준이며 엔드포인트별 weight는 계산하지 않는다)
     - 429/418: Retry-After 헤더 준수 및 지터 백오프, 최대 MAX_RETRIES
+      (IP 단위 제한이므로 다른 스레드의 요청도 함께 미룬다)
     - 400: 잘못된 파라미터로 판단하고 로그 후 None 반환
     - 기타 오류는 예외를 발생시켜 상위에서 중단 여부 결정
     """
 
-    url = f"{BASE_URL}{path}"
+    url = URL_CACHE.get(path) or URL_CACHE.setdefault(path, BASE_URL + path)
     attempts = 0
     backoff = 5.0
     while True:
         attempts += 1
+        RATE_LIMITER.acquire()
         try:
             response = SESSION.get(url, params=params, timeout=15)
         except requests.RequestException as exc:  # 네트워크 예외는 재시도
@@ -88,12 +140,12 @@ def _get(path: str, params: dict[str, Any] | None = None) -> Any:
                 logging.error("Request failed after retries: %s %s", url, exc)
                 raise
             logging.warning("Request error (%s) -> retrying #%d", exc, attempts)
-            time.sleep(jitter_delay(backoff))
+            _wait(jitter_delay(backoff))
             backoff *= 2
             continue
 
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
 
         if response.status_code in {429, 418}:
             if attempts > MAX_RETRIES:
@@ -108,7 +160,7 @@ def _get(path: str, params: dict[str, Any] | None = None) -> Any:
                 attempts,
                 MAX_RETRIES,
             )
-            time.sleep(jitter_delay(delay))
+            RATE_LIMITER.pause(jitter_delay(delay))
             backoff = min(backoff * 2, 60)
             continue
 
@@ -127,54 +179,157 @@ def ensure_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def is_plain_numeric(frame: pd.DataFrame) -> bool:
+    """결측치 없이 정수/실수 컬럼으로만 구성된 프레임인지 여부 (Kline 계열)."""
+
+    return all(
+        pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_float_dtype(dtype)
+        for dtype in frame.dtypes
+    ) and not frame.isna().to_numpy().any()
+
+
+def format_numeric_csv(frame: pd.DataFrame) -> str:
+    """숫자 전용 프레임을 헤더 포함 CSV 문자열로 직렬화.
+
+    컬럼을 파이썬 리스트로 한 번에 꺼낸 뒤 고정 포맷 문자열로 행을 이어 붙여,
+    셀 단위로 dtype 분기를 거치는 ``to_csv``보다 빠르게 같은 내용을 만든다.
+    """
+
+    template = ",".join(["{}"] * frame.shape[1]) + "\n"
+    columns = [frame[name].tolist() for name in frame.columns]
+    header = ",".join(frame.columns) + "\n"
+    return header + "".join(template.format(*row) for row in zip(*columns))
+
+
+def render_csv(frame: pd.DataFrame) -> bytes:
+    """프레임을 헤더 포함 CSV 바이트로 메모리에서 직렬화.
+
+    숫자 전용 프레임(Kline/Index/Mark/Premium)은 :func:`format_numeric_csv`를 쓰고,
+    그 외에는 ``to_csv``를 쓴다.
+    """
+
+    if is_plain_numeric(frame):
+        return format_numeric_csv(frame).encode("utf-8")
+    return frame.to_csv(index=False).encode("utf-8")
+
+
 def write_with_metadata(path: Path, frame: pd.DataFrame) -> None:
-    """CSV 파일을 작성하면서 첫 줄에 수집 시각 메타 정보를 추가."""
+    """CSV 파일을 작성하면서 첫 줄에 수집 시각 메타 정보를 추가.
+
+    메타 정보와 본문을 하나의 버퍼로 만든 뒤 파일당 한 번만 기록한다.
+    """
 
     ensure_dir(path)
     collected_at = now_kst().strftime("%Y-%m-%d %H:%M:%S %Z")
-    with path.open("w", encoding="utf-8") as handle:
-        handle.write(f"# collected_at_kst,{collected_at}\n")
-    frame.to_csv(path, mode="a", index=False)
+    metadata = f"# collected_at_kst,{collected_at}\n".encode("utf-8")
+    path.write_bytes(metadata + render_csv(frame))
     logging.info("Saved %s (%d rows)", path, len(frame))
 
 
+def interval_to_ms(interval: str) -> int | None:
+    """Binance 간격 문자열(예: 15m, 1h)을 밀리초로 변환. 월(1M) 등은 None."""
+
+    unit_ms = INTERVAL_UNIT_MS.get(interval[-1:])
+    if unit_ms is None or not interval[:-1].isdigit():
+        return None
+    return int(interval[:-1]) * unit_ms
+
+
+def _fetch_page(path: str, params: dict[str, Any]) -> list[Any]:
+    """단일 페이지 요청. API 오류나 비정상 응답은 빈 리스트로 반환."""
+
+    payload = _get(path, params)
+    if isinstance(payload, dict) and "code" in payload:
+        logging.error("API error for %s: %s", path, payload)
+        return []
+    if not isinstance(payload, list):
+        return []
+    return payload
+
+
+def _slice_page(
+    page: list[Any],
+    start_ts: float,
+    stop_ts: float,
+    extract_timestamp: Callable[[Any], int],
+) -> list[Any]:
+    """오름차순 페이지에서 start_ts <= ts < stop_ts 구간만 잘라 반환.
+
+    경계가 페이지 바깥이면 비교 한 번으로 끝내고, 페이지에 걸칠 때만 이진 탐색한다.
+    """
+
+    if not page:
+        return page
+    lo = 0
+    if extract_timestamp(page[0]) < start_ts:
+        lo = bisect.bisect_left(page, start_ts, key=extract_timestamp)
+    hi = len(page)
+    if extract_timestamp(page[-1]) >= stop_ts:
+        hi = bisect.bisect_left(page, stop_ts, lo, key=extract_timestamp)
+    return page[lo:hi]
+
+
 def paginate_fetch(
     *,
     path: str,
     symbol: str,
     limit: int,
     earliest_ms: int,
-    build_params: Callable[[dict[str, Any]], None],
+    latest_ms: int,
+    extra_params: dict[str, Any],
     extract_timestamp: Callable[[Any], int],
     symbol_param: str = "symbol",
+    cadence_ms: int | None = None,
 ) -> list[Any]:
     """공통 페이지네이션 유틸리티 (과거→최신 순 정렬).
 
     Binance 응답은 기본적으로 과거→최신 순으로 정렬되어 있으며, endTime을 줄 경우
-    해당 시점 이전의 데이터를 반환한다. earliest_ms 이전의 데이터는 제외한다.
+    해당 시점 이전의 데이터를 반환한다. earliest_ms 이전의 데이터는 제외하고,
+    첫 요청은 실행 시작 시각 스냅샷인 ``latest_ms``를 endTime으로 사용한다.
     일부 엔드포인트는 심볼 파라미터 키가 `symbol` 대신 `pair` 등을 요구하므로,
-    ``symbol_param`` 인수를 통해 키 이름을 지정할 수 있다.
+    ``symbol_param`` 인수를 통해 키 이름을 지정할 수 있다. ``interval``/``period`` 등
+    엔드포인트별 고정 파라미터는 ``extra_params``로 한 번만 전달한다.
+    행 간격(``cadence_ms``)을 알면 :func:`paginate_fetch_parallel`로 위임하고,
+    모르면 endTime을 한 페이지씩 거슬러 올라가는 순차 경로를 사용한다.
+    페이지는 :func:`_slice_page`로 잘라내므로 ``extract_timestamp``는 페이지당 양 끝과
+    경계 이진 탐색에서만 호출된다. orjson이 타임스탬프를 int로 디코딩하므로
+    ``operator.itemgetter``를 그대로 넘기면 된다.
     """
 
-    end_time: int | None = None
-    all_rows: list[Any] = []
+    if cadence_ms is not None:
+        return paginate_fetch_parallel(
+            path=path,
+            symbol=symbol,
+            limit=limit,
+            earliest_ms=earliest_ms,
+            latest_ms=latest_ms,
+            cadence_ms=cadence_ms,
+            extra_params=extra_params,
+            extract_timestamp=extract_timestamp,
+            symbol_param=symbol_param,
+        )
+
+    end_time = latest_ms
+    # endTime 역방향 페이징이므로 각 페이지는 이전 페이지보다 과거 구간이다.
+    # 페이지 내부는 이미 오름차순이라 경계 중복만 제거하고 앞쪽에 쌓으면 정렬이 유지된다.
+    pages: deque[list[Any]] = deque()
+    seen_min_ts: float = math.inf
 
     while True:
-        params: dict[str, Any] = {symbol_param: symbol, "limit": limit}
-        if end_time is not None:
-            params["endTime"] = end_time
-        build_params(params)
-        payload = _get(path, params)
+        params: dict[str, Any] = {
+            symbol_param: symbol,
+            "limit": limit,
+            "endTime": end_time,
+            **extra_params,
+        }
+        payload = _fetch_page(path, params)
         if not payload:
             break
-        if isinstance(payload, dict) and "code" in payload:
-            logging.error("API error for %s: %s", path, payload)
-            break
-        if not isinstance(payload, list) or not payload:
-            break
 
-        valid_rows = [row for row in payload if extract_timestamp(row) >= earliest_ms]
-        all_rows.extend(valid_rows)
+        valid_rows = _slice_page(payload, earliest_ms, seen_min_ts, extract_timestamp)
+        if valid_rows:
+            pages.appendleft(valid_rows)
+            seen_min_ts = extract_timestamp(valid_rows[0])
 
         first_ts = extract_timestamp(payload[0])
         if len(payload) == limit and first_ts > earliest_ms:
@@ -182,75 +337,181 @@ def paginate_fetch(
             continue
         break
 
-    # 정렬 및 중복 제거
-    unique_map: dict[int, Any] = {}
-    for row in all_rows:
-        unique_map[extract_timestamp(row)] = row
-    ordered = [unique_map[key] for key in sorted(unique_map.keys())]
-    return ordered
+    return list(chain.from_iterable(pages))
 
 
-def fetch_klines(symbol: str, interval: str, days: int) -> pd.DataFrame:
-    earliest_ms = to_ms(now_kst() - pd.Timedelta(days=days))
+def paginate_fetch_parallel(
+    *,
+    path: str,
+    symbol: str,
+    limit: int,
+    earliest_ms: int,
+    latest_ms: int,
+    cadence_ms: int,
+    extra_params: dict[str, Any],
+    extract_timestamp: Callable[[Any], int],
+    symbol_param: str = "symbol",
+) -> list[Any]:
+    """페이지 경계를 미리 계산해 모든 페이지를 동시에 요청.
+
+    한 페이지가 담는 구간(limit × cadence_ms)으로 earliest_ms부터 latest_ms까지 나누고,
+    각 구간의 마지막 행 시각을 endTime으로 하는 요청을 스레드 풀에서 동시에 보낸다.
+    응답은 구간 순서대로 이어 붙이며 경계의 중복 행은 제거한다.
+    비어 있는 구간이 하나라도 있으면 :func:`paginate_fetch` 순차 경로로 대체한다.
+    """
+
+    span_ms = limit * cadence_ms
+    first_end = earliest_ms + span_ms - cadence_ms
+    end_times = list(range(first_end, latest_ms + span_ms, span_ms))
+    if not end_times:
+        return []
+
+    def fetch(end_time: int) -> list[Any]:
+        params: dict[str, Any] = {
+            symbol_param: symbol,
+            "limit": limit,
+            "endTime": end_time,
+            **extra_params,
+        }
+        return _fetch_page(path, params)
+
+    workers = min(MAX_PAGE_WORKERS, len(end_times))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pages = list(executor.map(fetch, end_times))
+
+    # endTime만 준 요청은 그 이전 limit개 행을 반환하므로 정상 응답은 비지 않는다.
+    # 빈 페이지(오류 응답 포함)가 있으면 구멍 난 시계열이 되므로 순차 경로로 다시 수집한다.
+    if not all(pages):
+        logging.warning(
+            "Empty window while fetching %s for %s -> falling back to serial paging",
+            path,
+            symbol,
+        )
+        return paginate_fetch(
+            path=path,
+            symbol=symbol,
+            limit=limit,
+            earliest_ms=earliest_ms,
+            latest_ms=latest_ms,
+            extra_params=extra_params,
+            extract_timestamp=extract_timestamp,
+            symbol_param=symbol_param,
+        )
+
+    rows: list[Any] = []
+    next_ts = earliest_ms
+    for page in pages:
+        valid_rows = _slice_page(page, next_ts, math.inf, extract_timestamp)
+        if valid_rows:
+            rows.extend(valid_rows)
+            next_ts = extract_timestamp(valid_rows[-1]) + 1
+    return rows
+
+
+# Kline 계열 응답의 (컬럼명, dtype) 스키마. 응답 배열의 위치 순서와 일치하며,
+# 스키마 뒤에 오는 미사용 필드(kline의 `ignore` 등)는 DataFrame에 포함하지 않는다.
+KLINE_SCHEMA: list[tuple[str, type]] = [
+    ("open_time", np.int64),
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("volume", np.float64),
+    ("close_time", np.int64),
+    ("quote_asset_volume", np.float64),
+    ("trades", np.int64),
+    ("taker_base_volume", np.float64),
+    ("taker_quote_volume", np.float64),
+]
+INDEX_KLINE_SCHEMA: list[tuple[str, type]] = [
+    ("open_time", np.int64),
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("volume", np.float64),
+    ("close_time", np.int64),
+    ("base_asset_volume", np.float64),
+    ("trades", np.int64),
+]
+# dict 행 응답에서 숫자로 변환하지 않을 문자열 컬럼
+TEXT_COLUMNS = ["symbol", "pair"]
+
+
+def rows_to_frame(rows: list[Any], schema: list[tuple[str, type]]) -> pd.DataFrame:
+    """배열형 응답 행을 컬럼 단위 numpy 배열로 변환해 DataFrame을 구성.
+
+    Binance는 가격/거래량을 문자열로 반환하므로, 행 리스트를 그대로 넘겨 pandas가
+    object dtype으로 추론하게 두는 대신 스키마의 dtype으로 한 번에 변환한다.
+    스키마보다 긴 행의 나머지 필드는 무시된다.
+    """
+
+    count = len(rows)
+    return pd.DataFrame(
+        {
+            name: np.fromiter((row[idx] for row in rows), dtype=dtype, count=count)
+            for idx, (name, dtype) in enumerate(schema)
+        }
+    )
+
+
+def coerce_numeric(frame: pd.DataFrame) -> pd.DataFrame:
+    """문자열로 반환된 수치 컬럼을 컬럼 단위로 한 번에 숫자 dtype으로 변환.
+
+    통계/펀딩 응답은 dict 행이라 스키마를 고정하지 않고, ``TEXT_COLUMNS``를 제외한
+    비수치 컬럼 중 빈 문자열을 뺀 모든 값이 숫자로 해석되는 컬럼만 변환한다.
+    빈 문자열은 NaN이 되며, 해석되지 않는 값이 하나라도 있으면 컬럼을 그대로 둔다.
+    """
+
+    for column in frame.columns.difference(TEXT_COLUMNS):
+        if pd.api.types.is_numeric_dtype(frame[column]):
+            continue
+        try:
+            frame[column] = pd.to_numeric(frame[column].replace("", np.nan))
+        except (TypeError, ValueError):
+            continue
+    return frame
+
+
+def fetch_klines(
+    symbol: str, interval: str, earliest_ms: int, latest_ms: int
+) -> pd.DataFrame:
     rows = paginate_fetch(
         path="/fapi/v1/klines",
         symbol=symbol,
         limit=MAX_KLINE_LIMIT,
         earliest_ms=earliest_ms,
-        build_params=lambda p: p.update({"interval": interval}),
-        extract_timestamp=lambda row: int(row[0]),
+        latest_ms=latest_ms,
+        extra_params={"interval": interval},
+        extract_timestamp=itemgetter(0),
+        cadence_ms=interval_to_ms(interval),
     )
-    columns = [
-        "open_time",
-        "open",
-        "high",
-        "low",
-        "close",
-        "volume",
-        "close_time",
-        "quote_asset_volume",
-        "trades",
-        "taker_base_volume",
-        "taker_quote_volume",
-        "ignore",
-    ]
-    frame = pd.DataFrame(rows, columns=columns)
-    frame = frame[frame["open_time"] >= earliest_ms]
-    return frame
+    # paginate_fetch가 earliest_ms 이후 행만 반환하므로 추가 필터링은 하지 않는다.
+    return rows_to_frame(rows, KLINE_SCHEMA)
 
 
 def fetch_index_like(
     symbol: str,
     endpoint: str,
     interval: str,
-    days: int,
+    earliest_ms: int,
+    latest_ms: int,
     *,
     symbol_param: str = "symbol",
 ) -> pd.DataFrame:
-    earliest_ms = to_ms(now_kst() - pd.Timedelta(days=days))
     rows = paginate_fetch(
         path=endpoint,
         symbol=symbol,
         limit=MAX_KLINE_LIMIT,
         earliest_ms=earliest_ms,
-        build_params=lambda p: p.update({"interval": interval}),
-        extract_timestamp=lambda row: int(row[0]),
+        latest_ms=latest_ms,
+        extra_params={"interval": interval},
+        extract_timestamp=itemgetter(0),
+        cadence_ms=interval_to_ms(interval),
         symbol_param=symbol_param,
     )
-    columns = [
-        "open_time",
-        "open",
-        "high",
-        "low",
-        "close",
-        "volume",
-        "close_time",
-        "base_asset_volume",
-        "trades",
-    ]
-    frame = pd.DataFrame(rows, columns=columns)
-    frame = frame[frame["open_time"] >= earliest_ms]
-    return frame
+    # paginate_fetch가 earliest_ms 이후 행만 반환하므로 추가 필터링은 하지 않는다.
+    return rows_to_frame(rows, INDEX_KLINE_SCHEMA)
 
 
 def fetch_stat_series(
@@ -258,55 +519,50 @@ def fetch_stat_series(
     endpoint: str,
     *,
     period: str | None,
-    days: int,
+    earliest_ms: int,
+    latest_ms: int,
 ) -> pd.DataFrame:
-    earliest_ms = to_ms(now_kst() - pd.Timedelta(days=days))
-
-    def build(params: dict[str, Any]) -> None:
-        if period is not None:
-            params["period"] = period
-
     rows = paginate_fetch(
         path=endpoint,
         symbol=symbol,
         limit=MAX_STAT_LIMIT,
         earliest_ms=earliest_ms,
-        build_params=build,
-        extract_timestamp=lambda row: int(row["timestamp"]),
+        latest_ms=latest_ms,
+        extra_params={"period": period} if period is not None else {},
+        extract_timestamp=itemgetter("timestamp"),
+        cadence_ms=interval_to_ms(period) if period is not None else None,
     )
-    frame = pd.DataFrame(rows)
+    frame = coerce_numeric(pd.DataFrame(rows))
     if not frame.empty:
         frame = frame.sort_values("timestamp")
     return frame
 
 
-def fetch_funding(symbol: str, days: int) -> pd.DataFrame:
-    earliest_ms = to_ms(now_kst() - pd.Timedelta(days=days))
-
-    def build(params: dict[str, Any]) -> None:
-        params["startTime"] = earliest_ms
-
+def fetch_funding(symbol: str, earliest_ms: int, latest_ms: int) -> pd.DataFrame:
     rows = paginate_fetch(
         path="/fapi/v1/fundingRate",
         symbol=symbol,
         limit=MAX_STAT_LIMIT,
         earliest_ms=earliest_ms,
-        build_params=build,
-        extract_timestamp=lambda row: int(row["fundingTime"]),
+        latest_ms=latest_ms,
+        extra_params={"startTime": earliest_ms},
+        extract_timestamp=itemgetter("fundingTime"),
     )
-    frame = pd.DataFrame(rows)
+    frame = coerce_numeric(pd.DataFrame(rows))
     if not frame.empty:
         frame = frame.sort_values("fundingTime")
     return frame
 
 
-def collect_symbol(symbol: str, out_dir: Path, stats: FetchStats) -> None:
-    logging.info("Collecting data for %s", symbol)
+def symbol_tasks(
+    symbol: str, earliest_ms: int, latest_ms: int
+) -> list[tuple[str, Callable[[], pd.DataFrame]]]:
+    """심볼별 (파일명, 로더) 목록을 생성."""
 
-    tasks: Iterable[tuple[str, Callable[[], pd.DataFrame]]] = [
+    return [
         (
             f"{symbol}_klines_{INTERVAL}_{DAYS}d.csv",
-            lambda: fetch_klines(symbol, INTERVAL, DAYS),
+            lambda: fetch_klines(symbol, INTERVAL, earliest_ms, latest_ms),
         ),
         (
             f"{symbol}_oi_{OI_PERIOD}_{DAYS}d.csv",
@@ -314,12 +570,13 @@ def collect_symbol(symbol: str, out_dir: Path, stats: FetchStats) -> None:
                 symbol,
                 "/futures/data/openInterestHist",
                 period=OI_PERIOD,
-                days=DAYS,
+                earliest_ms=earliest_ms,
+                latest_ms=latest_ms,
             ),
         ),
         (
             f"{symbol}_funding_{DAYS}d.csv",
-            lambda: fetch_funding(symbol, DAYS),
+            lambda: fetch_funding(symbol, earliest_ms, latest_ms),
         ),
         (
             f"{symbol}_global_ls_{DAYS}d.csv",
@@ -327,7 +584,8 @@ def collect_symbol(symbol: str, out_dir: Path, stats: FetchStats) -> None:
                 symbol,
                 "/futures/data/globalLongShortAccountRatio",
                 period=RATIO_PERIOD,
-                days=DAYS,
+                earliest_ms=earliest_ms,
+                latest_ms=latest_ms,
             ),
         ),
         (
@@ -336,7 +594,8 @@ def collect_symbol(symbol: str, out_dir: Path, stats: FetchStats) -> None:
                 symbol,
                 "/futures/data/topLongShortAccountRatio",
                 period=RATIO_PERIOD,
-                days=DAYS,
+                earliest_ms=earliest_ms,
+                latest_ms=latest_ms,
             ),
         ),
         (
@@ -345,7 +604,8 @@ def collect_symbol(symbol: str, out_dir: Path, stats: FetchStats) -> None:
                 symbol,
                 "/futures/data/topLongShortPositionRatio",
                 period=RATIO_PERIOD,
-                days=DAYS,
+                earliest_ms=earliest_ms,
+                latest_ms=latest_ms,
             ),
         ),
         (
@@ -354,7 +614,8 @@ def collect_symbol(symbol: str, out_dir: Path, stats: FetchStats) -> None:
                 symbol,
                 "/futures/data/takerBuySellVol",
                 period=RATIO_PERIOD,
-                days=DAYS,
+                earliest_ms=earliest_ms,
+                latest_ms=latest_ms,
             ),
         ),
         (
@@ -363,40 +624,83 @@ def collect_symbol(symbol: str, out_dir: Path, stats: FetchStats) -> None:
                 symbol,
                 "/fapi/v1/indexPriceKlines",
                 INTERVAL,
-                DAYS,
+                earliest_ms,
+                latest_ms,
                 symbol_param="pair",
             ),
         ),
         (
             f"{symbol}_mark_{INTERVAL}_{DAYS}d.csv",
             lambda: fetch_index_like(
-                symbol, "/fapi/v1/markPriceKlines", INTERVAL, DAYS
+                symbol,
+                "/fapi/v1/markPriceKlines",
+                INTERVAL,
+                earliest_ms,
+                latest_ms,
             ),
         ),
         (
             f"{symbol}_premium_{INTERVAL}_{DAYS}d.csv",
             lambda: fetch_index_like(
-                symbol, "/fapi/v1/premiumIndexKlines", INTERVAL, DAYS
+                symbol,
+                "/fapi/v1/premiumIndexKlines",
+                INTERVAL,
+                earliest_ms,
+                latest_ms,
             ),
         ),
     ]
 
-    for filename, loader in tasks:
-        path = out_dir / filename
-        try:
-            frame = loader()
-        except Exception:  # noqa: BLE001 - 상위에서 로깅 후 계속 진행
-            stats.skipped += 1
-            logging.exception("Failed to collect %s for %s", filename, symbol)
-            continue
 
-        if frame.empty:
-            stats.skipped += 1
-            logging.warning("No data returned for %s", filename)
-            continue
+def collect_symbols(
+    symbols: Iterable[str],
+    out_dir: Path,
+    earliest_ms: int,
+    latest_ms: int,
+) -> Counter[str]:
+    """모든 심볼의 엔드포인트를 하나의 스레드 풀에서 동시에 수집.
+
+    요청은 네트워크 I/O 위주이므로 심볼 경계와 무관하게 한 번에 제출해 대기 시간을
+    겹치고, 결과 기록(pandas/파일 I/O)은 호출 스레드에서만 처리한다.
+    ``earliest_ms``/``latest_ms``는 실행 시작 시 한 번 계산한 구간을 모든 파일에
+    동일하게 적용한다.
+    파일별 결과(``success``/``skipped``)를 집계한 Counter를 반환한다.
+    """
+
+    outcomes: Counter[str] = Counter()
 
-        write_with_metadata(path, frame)
-        stats.success += 1
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for symbol in symbols:
+            logging.info("Collecting data for %s", symbol)
+            for filename, loader in symbol_tasks(symbol, earliest_ms, latest_ms):
+                futures[executor.submit(loader)] = (symbol, filename)
+
+        try:
+            for future in as_completed(futures):
+                symbol, filename = futures[future]
+                path = out_dir / filename
+                try:
+                    frame = future.result()
+                except Exception:  # noqa: BLE001 - 상위에서 로깅 후 계속 진행
+                    outcomes["skipped"] += 1
+                    logging.exception("Failed to collect %s for %s", filename, symbol)
+                    continue
+
+                if frame.empty:
+                    outcomes["skipped"] += 1
+                    logging.warning("No data returned for %s", filename)
+                    continue
+
+                write_with_metadata(path, frame)
+                outcomes["success"] += 1
+        except KeyboardInterrupt:
+            # 대기 중인 워커를 깨우고 아직 시작하지 않은 요청은 취소한다.
+            SHUTDOWN.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    return outcomes
 
 
 def configure_logging() -> None:
@@ -409,7 +713,6 @@ def configure_logging() -> None:
 
 def main() -> int:
     configure_logging()
-    stats = FetchStats()
     out_dir = Path(OUT_DIR)
     logging.info(
         "Starting collection for symbols=%s interval=%s days=%d",
@@ -418,15 +721,17 @@ def main() -> int:
         DAYS,
     )
 
-    for symbol in SYMBOLS:
-        collect_symbol(symbol, out_dir, stats)
+    # 수집 구간은 실행 단위로 고정해 파일 간 경계가 어긋나지 않도록 한다.
+    latest_ms = to_ms(now_kst())
+    earliest_ms = latest_ms - DAYS * DAY_MS
+    stats = collect_symbols(SYMBOLS, out_dir, earliest_ms, latest_ms)
 
     logging.info(
         "Collection finished. Success=%d skipped=%d",
-        stats.success,
-        stats.skipped,
+        stats["success"],
+        stats["skipped"],
     )
-    return 0 if stats.success > 0 else 1
+    return 0 if stats["success"] > 0 else 1
 
 
 if __name__ == "__main__":
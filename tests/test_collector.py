@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import threading
+import time
+from datetime import datetime
+from operator import itemgetter
 from typing import Any
 
 import pytest
@@ -24,7 +28,8 @@ def test_paginate_fetch_uses_custom_symbol_param(monkeypatch):
         symbol="BTCUSDT",
         limit=1,
         earliest_ms=0,
-        build_params=lambda params: None,
+        latest_ms=100,
+        extra_params={"interval": "1m"},
         extract_timestamp=lambda row: int(row[0]),
         symbol_param="pair",
     )
@@ -32,18 +37,124 @@ def test_paginate_fetch_uses_custom_symbol_param(monkeypatch):
     assert rows == [[0]]
     assert captured["path"] == "/example"
     assert captured["params"]["pair"] == "BTCUSDT"
+    assert captured["params"]["interval"] == "1m"
+    assert captured["params"]["endTime"] == 100
     assert "symbol" not in captured["params"]
 
 
+def test_paginate_fetch_merges_backward_pages_in_order(monkeypatch):
+    pages = {
+        60: [[30], [40], [50]],
+        29: [[10], [20], [30]],
+        9: [[0], [5], [10]],
+    }
+    calls: list[int] = []
+
+    def fake_get(path: str, params: dict[str, Any]) -> list[list[int]]:
+        calls.append(params["endTime"])
+        return pages[params["endTime"]]
+
+    monkeypatch.setattr(collector, "_get", fake_get)
+
+    rows = collector.paginate_fetch(
+        path="/example",
+        symbol="BTCUSDT",
+        limit=3,
+        earliest_ms=5,
+        latest_ms=60,
+        extra_params={},
+        extract_timestamp=lambda row: int(row[0]),
+    )
+
+    assert calls == [60, 29, 9]
+    assert rows == [[5], [10], [20], [30], [40], [50]]
+
+
+def test_slice_page_bounds():
+    page = [[0], [10], [20], [30], [40]]
+    ts = itemgetter(0)
+
+    assert collector._slice_page(page, 0, float("inf"), ts) == page
+    assert collector._slice_page(page, 15, 40, ts) == [[20], [30]]
+    assert collector._slice_page(page, 10, 10, ts) == []
+    assert collector._slice_page(page, 50, float("inf"), ts) == []
+
+
+def test_interval_to_ms():
+    assert collector.interval_to_ms("15m") == 15 * 60_000
+    assert collector.interval_to_ms("1h") == 3_600_000
+    assert collector.interval_to_ms("1d") == collector.DAY_MS
+    assert collector.interval_to_ms("1M") is None
+
+
+def test_paginate_fetch_parallel_covers_window_without_gaps(monkeypatch):
+    now_ms = 100
+    end_times: list[int] = []
+
+    def fake_get(path: str, params: dict[str, Any]) -> list[list[int]]:
+        end = params["endTime"]
+        end_times.append(end)
+        return [[ts] for ts in (end - 20, end - 10, end) if ts <= now_ms]
+
+    def fail_now_kst() -> datetime:
+        raise AssertionError("window end must come from latest_ms")
+
+    monkeypatch.setattr(collector, "_get", fake_get)
+    monkeypatch.setattr(collector, "now_kst", fail_now_kst)
+
+    rows = collector.paginate_fetch(
+        path="/example",
+        symbol="BTCUSDT",
+        limit=3,
+        earliest_ms=0,
+        latest_ms=now_ms,
+        extra_params={},
+        extract_timestamp=lambda row: int(row[0]),
+        cadence_ms=10,
+    )
+
+    assert sorted(end_times) == [20, 50, 80, 110]
+    assert rows == [[ts] for ts in range(0, 101, 10)]
+
+
+@pytest.mark.parametrize("failing_end", [50, 110])
+def test_paginate_fetch_parallel_refetches_serially_on_failed_window(
+    monkeypatch, failing_end
+):
+    now_ms = 100
+    parallel_calls: list[int] = []
+
+    def fake_get(path: str, params: dict[str, Any]) -> Any:
+        end = params["endTime"]
+        parallel_calls.append(end)
+        if end == failing_end and len(parallel_calls) <= 4:
+            return {"code": -1121, "msg": "Invalid symbol."}
+        top = min(end, now_ms) // 10 * 10
+        return [[ts] for ts in (top - 20, top - 10, top) if ts >= 0]
+
+    monkeypatch.setattr(collector, "_get", fake_get)
+
+    rows = collector.paginate_fetch(
+        path="/example",
+        symbol="BTCUSDT",
+        limit=3,
+        earliest_ms=0,
+        latest_ms=now_ms,
+        extra_params={},
+        extract_timestamp=lambda row: int(row[0]),
+        cadence_ms=10,
+    )
+
+    assert rows == [[ts] for ts in range(0, 101, 10)]
+
+
 def test_fetch_index_like_forwards_symbol_param(monkeypatch):
     expected_rows = [[0, 1, 2, 3, 4, 5, 6, 7, 8]]
 
     def fake_paginate_fetch(**kwargs: Any) -> list[list[int]]:
         assert kwargs["symbol_param"] == "pair"
-        build_params = kwargs["build_params"]
-        params: dict[str, Any] = {}
-        build_params(params)
-        assert params == {"interval": "1m"}
+        assert kwargs["extra_params"] == {"interval": "1m"}
+        assert kwargs["latest_ms"] == 100
         return expected_rows
 
     monkeypatch.setattr(collector, "paginate_fetch", fake_paginate_fetch)
@@ -52,7 +163,8 @@ def test_fetch_index_like_forwards_symbol_param(monkeypatch):
         "BTCUSDT",
         "/fapi/v1/indexPriceKlines",
         "1m",
-        1,
+        0,
+        100,
         symbol_param="pair",
     )
 
@@ -69,3 +181,160 @@ def test_fetch_index_like_forwards_symbol_param(monkeypatch):
         "base_asset_volume",
         "trades",
     ]
+
+
+def test_collect_symbols_runs_loaders_concurrently_and_counts(monkeypatch, tmp_path):
+    frame = pd.DataFrame({"open_time": [0], "value": [1.0]})
+    # 로더가 둘씩 동시에 실행되어야 통과하므로, 순차 실행이면 타임아웃으로 실패한다.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_fetch(*args: Any, **kwargs: Any) -> pd.DataFrame:
+        barrier.wait()
+        return frame
+
+    def failing_fetch(*args: Any, **kwargs: Any) -> pd.DataFrame:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(collector, "fetch_klines", fake_fetch)
+    monkeypatch.setattr(collector, "fetch_index_like", fake_fetch)
+    monkeypatch.setattr(collector, "fetch_stat_series", fake_fetch)
+    monkeypatch.setattr(collector, "fetch_funding", failing_fetch)
+
+    stats = collector.collect_symbols(["BTCUSDT", "ETHUSDT"], tmp_path, 0, 100)
+
+    assert stats == {"success": 18, "skipped": 2}
+    written = sorted(p.name for p in tmp_path.iterdir())
+    assert len(written) == 18
+    assert not any("funding" in name for name in written)
+    content = (tmp_path / written[0]).read_text(encoding="utf-8").splitlines()
+    assert content[0].startswith("# collected_at_kst,")
+    assert content[1] == "open_time,value"
+
+
+def test_fetch_klines_builds_typed_columns(monkeypatch):
+    raw = [
+        [
+            1000,
+            "1.5",
+            "2.0",
+            "1.0",
+            "1.8",
+            "10.25",
+            1899,
+            "18.0",
+            7,
+            "4.0",
+            "7.2",
+            "0",
+        ]
+    ]
+    monkeypatch.setattr(collector, "paginate_fetch", lambda **kwargs: raw)
+
+    frame = collector.fetch_klines("BTCUSDT", "15m", 0, 100)
+
+    assert frame["open_time"].dtype == "int64"
+    assert frame["trades"].dtype == "int64"
+    assert frame["open"].dtype == "float64"
+    assert frame.iloc[0]["volume"] == 10.25
+    assert "ignore" not in frame.columns
+    assert len(frame.columns) == 11
+
+
+def test_write_with_metadata_writes_text_frames_with_pandas(tmp_path):
+    path = tmp_path / "out" / "frame.csv"
+
+    frame = pd.DataFrame(
+        {"symbol": ["BTCUSDT", "BTCUSDT"], "b": [19000000.0, 0.00001]}
+    )
+    collector.write_with_metadata(path, frame)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("# collected_at_kst,")
+    assert lines[1:] == ["symbol,b", "BTCUSDT,19000000.0", "BTCUSDT,1e-05"]
+
+
+def test_coerce_numeric_keeps_unparseable_text_columns():
+    frame = pd.DataFrame(
+        {
+            "symbol": ["BTCUSDT", "BTCUSDT"],
+            "contractType": ["PERPETUAL", "PERPETUAL"],
+            "mixed": ["1.5", "n/a"],
+            "ratio": ["1.5", ""],
+        }
+    )
+
+    frame = collector.coerce_numeric(frame)
+
+    assert frame["contractType"].tolist() == ["PERPETUAL", "PERPETUAL"]
+    assert frame["mixed"].tolist() == ["1.5", "n/a"]
+    assert frame["ratio"].dtype == "float64"
+    assert frame.iloc[0]["ratio"] == 1.5
+    assert pd.isna(frame.iloc[1]["ratio"])
+
+
+def test_fetch_funding_converts_numeric_strings(monkeypatch):
+    raw = [
+        {
+            "symbol": "BTCUSDT",
+            "fundingRate": "-0.00010000",
+            "fundingTime": 1000,
+            "markPrice": "",
+        },
+        {
+            "symbol": "BTCUSDT",
+            "fundingRate": "0.00025000",
+            "fundingTime": 2000,
+            "markPrice": "27123.45",
+        },
+    ]
+    monkeypatch.setattr(collector, "paginate_fetch", lambda **kwargs: raw)
+
+    frame = collector.fetch_funding("BTCUSDT", 0, 100)
+
+    assert frame["symbol"].tolist() == ["BTCUSDT", "BTCUSDT"]
+    assert frame["fundingTime"].dtype == "int64"
+    assert frame["fundingRate"].dtype == "float64"
+    assert frame["fundingRate"].tolist() == [-0.0001, 0.00025]
+    assert pd.isna(frame.iloc[0]["markPrice"])
+    assert frame.iloc[1]["markPrice"] == 27123.45
+
+
+def test_format_numeric_csv_matches_pandas_output():
+    frame = collector.rows_to_frame(
+        [
+            [0, "1.5", "2.0", "1.0", "1.8", "10.25", 899, "18.0", 7, "4.0", "7.2"],
+            [900, "0.1", "0.3", "0.1", "0.2", "0", 1799, "0.00001", 0, "0", "0"],
+        ],
+        collector.KLINE_SCHEMA,
+    )
+
+    assert collector.is_plain_numeric(frame)
+    assert collector.format_numeric_csv(frame) == frame.to_csv(index=False)
+
+
+def test_is_plain_numeric_rejects_text_and_missing_values():
+    assert not collector.is_plain_numeric(pd.DataFrame({"symbol": ["BTCUSDT"]}))
+    assert not collector.is_plain_numeric(pd.DataFrame({"rate": [float("nan")]}))
+
+
+def test_rate_limiter_pause_delays_next_acquire():
+    limiter = collector.RateLimiter(1000)
+    limiter.acquire()
+    limiter.pause(0.05)
+
+    started = time.monotonic()
+    limiter.acquire()
+
+    assert time.monotonic() - started >= 0.04
+
+
+def test_rate_limiter_wait_is_interrupted_by_shutdown():
+    limiter = collector.RateLimiter(1000)
+    limiter.pause(60)
+    collector.SHUTDOWN.set()
+    try:
+        with pytest.raises(RuntimeError):
+            limiter.acquire()
+    finally:
+        collector.SHUTDOWN.clear()
+